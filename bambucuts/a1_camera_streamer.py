@@ -13,8 +13,8 @@ Usage: python a1_streamer.py --address <IP> --access-code <CODE> [--port 8080]
 import argparse
 import asyncio
 import base64
+import contextlib
 import json
-import os
 import signal
 import ssl
 import struct
@@ -26,7 +26,7 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 
 JPEG_START = bytes([0xFF, 0xD8, 0xFF, 0xE0])
 JPEG_END   = bytes([0xFF, 0xD9])
-READ_CHUNK = 4096
+HEADER_SIZE = 16
 PORT       = 6000
 
 # Global WebSocket clients
@@ -402,7 +402,8 @@ async def write_frame(data: bytes, output_path: str = None) -> None:
         message = json.dumps({"type": "frame", "data": frame_b64})
         disconnected_clients = set()
         
-        for client in clients:
+        # Iterate over a snapshot: clients may connect or leave while we await
+        for client in list(clients):
             try:
                 await client.send(message)
             except (websockets.exceptions.ConnectionClosed, websockets.exceptions.WebSocketException):
@@ -419,10 +420,10 @@ async def write_frame(data: bytes, output_path: str = None) -> None:
 async def stream(address: str, access_code: str, output_path: Optional[str]) -> None:
     reader, writer = await open_tls_connection(address, PORT)
 
-    # Clean shutdown on Ctrl+C like the Rust task that calls .shutdown()
+    # Clean shutdown on Ctrl+C / SIGTERM like the Rust task that calls .shutdown()
     stop = asyncio.Event()
-    def _handle_sigint():
-        # print once; next SIGINT will just let the loop exit promptly
+    def _handle_shutdown():
+        # print once; next signal will just let the loop exit promptly
         if not stop.is_set():
             print("Exiting...", file=sys.stderr)
         stop.set()
@@ -432,57 +433,99 @@ async def stream(address: str, access_code: str, output_path: Optional[str]) ->
             pass
 
     loop = asyncio.get_running_loop()
-    try:
-        loop.add_signal_handler(signal.SIGINT, _handle_sigint)
-    except NotImplementedError:
-        # Windows without Proactor sometimes doesn't support add_signal_handler for SIGINT
-        signal.signal(signal.SIGINT, lambda *_: _handle_sigint())
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, _handle_shutdown)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler; fall back to a
+            # plain handler that only schedules the shutdown on the loop instead of
+            # closing the connection from inside the signal frame
+            try:
+                signal.signal(signum, lambda *_: loop.call_soon_threadsafe(_handle_shutdown))
+            except (ValueError, OSError):
+                # Signal can't be caught on this platform
+                pass
 
     # Send auth payload (same as Rust's get_auth_data + write_all)
     auth = build_auth_data(access_code)
     writer.write(auth)
     await writer.drain()
 
-    image: Optional[bytearray] = None
-    payload_size: int = 0
+    # Single-slot hand-off to the broadcaster: the reader never waits on slow
+    # clients, and a frame still pending when a newer one arrives is dropped
+    latest_frame: Optional[bytes] = None
+    frame_ready = asyncio.Event()
+    stream_done = False
+
+    async def broadcast_latest() -> None:
+        nonlocal latest_frame
+        # Once the stream has ended, return only after the last pending frame
+        # has been written, so --output always holds the final frame
+        while not (stream_done and latest_frame is None):
+            await frame_ready.wait()
+            frame_ready.clear()
+            if latest_frame is not None:
+                data, latest_frame = latest_frame, None
+                await write_frame(data, output_path)
+
+    broadcaster = asyncio.create_task(broadcast_latest())
+
+    def _on_broadcaster_done(task: asyncio.Task) -> None:
+        # A failed write (e.g. unwritable --output) must not leave the reader
+        # pulling frames that go nowhere; stop, and let stream() re-raise it
+        if not task.cancelled() and task.exception() is not None:
+            stop.set()
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    broadcaster.add_done_callback(_on_broadcaster_done)
 
     try:
         while not stop.is_set():
-            buf = await reader.read(READ_CHUNK)
-
-            if image is not None and buf:
-                image.extend(buf)
-                if len(image) > payload_size:
-                    print(f"ERROR: Received more data than expected: {len(image)} > {payload_size}", file=sys.stderr)
-                    image = None
-                    continue
-                if len(image) == payload_size:
-                    # Validate JPEG markers
-                    if not (len(image) >= 4 and image[:4] == JPEG_START):
-                        print("ERROR: Invalid JPEG start marker", file=sys.stderr)
-                    elif not (len(image) >= 2 and image[-2:] == JPEG_END):
-                        print("ERROR: Invalid JPEG end marker", file=sys.stderr)
-                    else:
-                        await write_frame(bytes(image), output_path)
-                    image = None
-
-            elif buf and len(buf) == 16:
-                # Like Rust: read 16-byte header; first 4 bytes encode payload size (LE u32)
-                # Rust code expanded to 8 bytes and used bincode to decode a usize,
-                # but effectively it's a little-endian 32-bit length.
-                payload_size = struct.unpack_from("<I", buf, 0)[0]
-                image = bytearray()
-            elif not buf:
-                # read() returned 0 bytes — mirror Rust's "Connection rejected..."
-                print("Connection rejected by the server.\nCheck the IP address and access code.", file=sys.stderr)
+            # Like Rust: read 16-byte header; first 4 bytes encode payload size (LE u32)
+            # Rust code expanded to 8 bytes and used bincode to decode a usize,
+            # but effectively it's a little-endian 32-bit length.
+            try:
+                header = await reader.readexactly(HEADER_SIZE)
+            except asyncio.IncompleteReadError:
+                # EOF — mirror Rust's "Connection rejected..."
+                # unless we closed the connection ourselves on shutdown
+                if not stop.is_set():
+                    print("Connection rejected by the server.\nCheck the IP address and access code.", file=sys.stderr)
                 break
-            # else: any other header sizes are ignored (behaves like the Rust loop)
+            payload_size = struct.unpack_from("<I", header, 0)[0]
+
+            # Read the payload in one exact-size buffer instead of growing it chunk by chunk
+            try:
+                image = await reader.readexactly(payload_size)
+            except asyncio.IncompleteReadError:
+                break
+
+            # Validate JPEG markers
+            if not (len(image) >= 4 and image[:4] == JPEG_START):
+                print("ERROR: Invalid JPEG start marker", file=sys.stderr)
+            elif not (len(image) >= 2 and image[-2:] == JPEG_END):
+                print("ERROR: Invalid JPEG end marker", file=sys.stderr)
+            else:
+                latest_frame = image
+                frame_ready.set()
+
+        # Stream ended (EOF or shutdown): flush the pending frame, if any
+        stream_done = True
+        frame_ready.set()
+        await broadcaster
     finally:
+        # Only reached with the broadcaster still running on the error path
+        broadcaster.cancel()
         try:
             writer.close()
             await writer.wait_closed()
         except Exception:
             pass
+        with contextlib.suppress(asyncio.CancelledError):
+            await broadcaster
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
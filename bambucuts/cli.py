@@ -10,6 +10,8 @@ Provides command-line tools for:
 
 import sys
 import argparse
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
 
@@ -19,22 +21,38 @@ def cmd_server(args):
     start_server(host=args.host, port=args.port, debug=args.debug)
 
 
-def cmd_svg2gcode(args):
-    """Convert SVG file to G-code."""
-    from bambucuts.gcodetools import GCodeTools, CuttingParameters
+def _convert_svg(params, input_path, output_path):
+    """Convert a single SVG to G-code and return the number of lines generated."""
+    from bambucuts.gcodetools import GCodeTools
 
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: Input file not found: {input_path}")
-        sys.exit(1)
+    tools = GCodeTools(params)
+    gcode = tools.svg_to_gcode(str(input_path), str(output_path))
+    return len(gcode.splitlines())
 
-    # Determine output path
-    if args.output:
-        output_path = Path(args.output)
-    else:
-        output_path = input_path.with_suffix('.gcode')
 
-    print(f"Converting {input_path} to G-code...")
+def _convert_svgs_parallel(executor, params, pending, jobs):
+    """Yield line counts in input order, keeping at most `jobs` files in flight.
+
+    Files are submitted as earlier results are consumed, so stopping at the
+    first failure leaves only the conversions already running to finish.
+    """
+    queue = iter(pending)
+    in_flight = deque(executor.submit(_convert_svg, params, i, o)
+                      for i, o in islice(queue, jobs))
+    while in_flight:
+        result = in_flight.popleft().result()
+        for input_path, output_path in islice(queue, 1):
+            in_flight.append(executor.submit(_convert_svg, params, input_path, output_path))
+        yield result
+
+
+def cmd_svg2gcode(args):
+    """Convert SVG file(s) to G-code."""
+    from bambucuts.gcodetools import CuttingParameters
+
+    if args.output and len(args.input) > 1:
+        print("Error: --output can only be used with a single input file")
+        sys.exit(1)
 
     # Set up cutting parameters
     params = CuttingParameters(
@@ -47,17 +65,53 @@ def cmd_svg2gcode(args):
         mirror_y=True  # Mirror Y by default for correct orientation
     )
 
-    # Convert
+    pending = []
+    for input_file in args.input:
+        input_path = Path(input_file)
+        if not input_path.exists():
+            print(f"Error: Input file not found: {input_path}")
+            sys.exit(1)
+
+        # Determine output path
+        if args.output:
+            output_path = Path(args.output)
+        else:
+            output_path = input_path.with_suffix('.gcode')
+
+        # Skip files whose G-code is newer than the SVG
+        if (args.skip_unchanged and output_path.exists()
+                and output_path.stat().st_mtime >= input_path.stat().st_mtime):
+            print(f"Skipping {input_path}: {output_path} is up to date")
+            continue
+
+        pending.append((input_path, output_path))
+
+    # Files are independent, so convert them in worker processes when asked to;
+    # results are still reported in input order
+    if args.jobs > 1 and len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+        results = _convert_svgs_parallel(executor, params, pending, args.jobs)
+    else:
+        executor = None
+        results = (_convert_svg(params, i, o) for i, o in pending)
+
     try:
-        tools = GCodeTools(params)
-        gcode = tools.svg_to_gcode(str(input_path), str(output_path))
+        for input_path, output_path in pending:
+            print(f"Converting {input_path} to G-code...")
 
-        # Write output (svg_to_gcode already writes the file if output_path is provided)
-        print(f"G-code written to: {output_path}")
-        print(f"Generated {len(gcode.splitlines())} lines of G-code")
-    except Exception as e:
-        print(f"Error converting SVG: {e}")
-        sys.exit(1)
+            # Convert (svg_to_gcode writes the file since output_path is provided)
+            try:
+                line_count = next(results)
+            except Exception as e:
+                print(f"Error converting SVG: {e}")
+                sys.exit(1)
+
+            print(f"G-code written to: {output_path}")
+            print(f"Generated {line_count} lines of G-code")
+    finally:
+        if executor:
+            executor.shutdown()
 
 
 def cmd_dxf2svg(args):
@@ -103,8 +157,10 @@ def main():
 
     # SVG to G-code command
     svg2gcode_parser = subparsers.add_parser('svg2gcode', help='Convert SVG to G-code')
-    svg2gcode_parser.add_argument('input', help='Input SVG file')
-    svg2gcode_parser.add_argument('-o', '--output', help='Output G-code file (default: input.gcode)')
+    svg2gcode_parser.add_argument('input', nargs='+', help='Input SVG file(s)')
+    svg2gcode_parser.add_argument('-o', '--output', help='Output G-code file (default: input.gcode, single input only)')
+    svg2gcode_parser.add_argument('--skip-unchanged', action='store_true', help='Skip inputs whose G-code file is newer than the SVG')
+    svg2gcode_parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of files to convert in parallel (default: 1)')
     svg2gcode_parser.add_argument('--tool-diameter', type=float, default=0.4, help='Tool diameter in mm (default: 0.4)')
     svg2gcode_parser.add_argument('--depth', type=float, default=-0.1, help='Cutting depth in mm (default: -0.1)')
     svg2gcode_parser.add_argument('--feed-rate', type=float, default=1000, help='Feed rate in mm/min (default: 1000)')
@@ -19,12 +19,10 @@ Usage as CLI:
     python compress_3mf.py template.3mf -o output.3mf -g my_gcode.gcode
 """
 
-import os
 import hashlib
 import zipfile
 import argparse
 from pathlib import Path
-from io import BytesIO
 from typing import Optional, Union
 
 
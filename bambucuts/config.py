@@ -3,7 +3,6 @@ Configuration for Bambu printer
 Reads and writes to ~/.bambucuts.conf
 """
 
-import os
 import json
 from pathlib import Path
 
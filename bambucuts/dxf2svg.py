@@ -4,8 +4,9 @@ DXF to SVG converter module.
 Converts DXF files to SVG format, ensuring connected paths remain continuous.
 """
 
+import argparse
 import math
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any
 import xml.etree.ElementTree as ET
 
 
@@ -168,6 +169,12 @@ class PathConnector:
         paths = []
         used = [False] * len(entities)
 
+        # Endpoints are checked for every candidate on every extension, so
+        # compute them (including the arc trig) once per entity
+        starts = [self._get_start_point(entity) for entity in entities]
+        ends = [self._get_end_point(entity) for entity in entities]
+        points_close = self._points_close
+
         for i in range(len(entities)):
             if used[i]:
                 continue
@@ -186,8 +193,7 @@ class PathConnector:
                     if used[j]:
                         continue
 
-                    start_point = self._get_start_point(entities[j])
-                    if self._points_close(end_point, start_point):
+                    if points_close(end_point, starts[j]):
                         path.append(entities[j])
                         used[j] = True
                         changed = True
@@ -199,8 +205,7 @@ class PathConnector:
                     if used[j]:
                         continue
 
-                    end_point_j = self._get_end_point(entities[j])
-                    if self._points_close(end_point_j, start_point):
+                    if points_close(ends[j], start_point):
                         path.insert(0, entities[j])
                         used[j] = True
                         changed = True
@@ -398,15 +403,18 @@ def convert_dxf_to_svg(dxf_file: str, svg_file: str):
     generator.generate(paths, svg_file)
 
 
-if __name__ == '__main__':
-    import sys
+def main():
+    """Command-line interface for the DXF to SVG converter."""
+    parser = argparse.ArgumentParser(description='Convert DXF to SVG with continuous paths')
+    parser.add_argument('input_dxf', help='Input DXF file path')
+    parser.add_argument('output_svg', nargs='?', help='Output SVG file path (default: <input_dxf>.svg)')
 
-    if len(sys.argv) < 2:
-        print("Usage: python dxf2svg.py <input.dxf> [output.svg]")
-        sys.exit(1)
+    args = parser.parse_args()
+    output_file = args.output_svg or args.input_dxf + '.svg'
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else input_file + '.svg'
+    convert_dxf_to_svg(args.input_dxf, output_file)
+    print(f"Converted {args.input_dxf} to {output_file}")
 
-    convert_dxf_to_svg(input_file, output_file)
-    print(f"Converted {input_file} to {output_file}")
+
+if __name__ == '__main__':
+    main()
@@ -13,11 +13,11 @@ Features:
 """
 
 import argparse
+import io
 import os
 import sys
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional
 from dataclasses import dataclass
-from pathlib import Path
 import xml.etree.ElementTree as ET
 import re
 import math
@@ -26,7 +26,6 @@ import numpy as np
 try:
     from svg_to_gcode.svg_parser import parse_file
     from svg_to_gcode.compiler import Compiler, interfaces
-    from svg_to_gcode.formulas import linear_map
 except ImportError:
     print("Error: svg-to-gcode package not found. Please install it with: pip install svg-to-gcode")
     sys.exit(1)
@@ -37,6 +36,21 @@ try:
 except ImportError:
     from svg_path_joiner import SVGPathJoinerRemoveMRegex
 
+# Matches one G-code word (axis/feed letter followed by its number)
+GCODE_WORD_RE = re.compile(r'([XYZF])([+-]?\d*\.?\d+)')
+
+# Matches an X or Y coordinate word so both can be rewritten in one pass
+XY_WORD_RE = re.compile(r'([XY])[+-]?\d*\.?\d+')
+
+# Single coordinate words; the group captures the number
+X_WORD_RE = re.compile(r'X([+-]?\d*\.?\d+)')
+Y_WORD_RE = re.compile(r'Y([+-]?\d*\.?\d+)')
+Z_WORD_RE = re.compile(r'Z([+-]?\d*\.?\d+)')
+
+# Coordinate words that may use scientific notation
+X_SCI_WORD_RE = re.compile(r'X([+-]?[\d\.eE\-+]+)')
+Y_SCI_WORD_RE = re.compile(r'Y([+-]?[\d\.eE\-+]+)')
+
 
 @dataclass
 class CuttingParameters:
@@ -439,10 +453,6 @@ class GCodeTools:
     def _calculate_svg_bounds(self, svg_path: str) -> Tuple[float, float, float, float]:
         """Calculate SVG bounds (min_x, min_y, max_x, max_y) from actual graphics content."""
         try:
-            # Parse SVG to get bounds
-            tree = ET.parse(svg_path)
-            root = tree.getroot()
-            
             # For top-left origin, we want to find the actual bounds of the graphics content
             # and position them so the top-left of the content is at (0,0)
             if self.params.origin_top_left:
@@ -470,7 +480,10 @@ class GCodeTools:
                         min_y, max_y = min(all_y), max(all_y)
                         return min_x, min_y, max_x, max_y
             
-            # Fallback to viewBox if curve parsing fails
+            # Fallback to viewBox if curve parsing fails; only the root
+            # element is needed, so stop parsing at its start tag
+            with open(svg_path, 'rb') as f:
+                _, root = next(ET.iterparse(f, events=('start',)))
             viewbox = root.get('viewBox')
             if viewbox:
                 parts = viewbox.split()
@@ -532,13 +545,12 @@ class GCodeTools:
             # Check if line contains Z coordinate
             if 'Z' in line and ('G0' in line or 'G1' in line):
                 # Extract Z value and add offset
-                import re
-                z_match = re.search(r'Z([+-]?\d*\.?\d+)', line)
+                z_match = Z_WORD_RE.search(line)
                 if z_match:
                     z_value = float(z_match.group(1))
                     new_z = z_value + self.params.z_offset
                     # Replace Z value in the line
-                    new_line = re.sub(r'Z[+-]?\d*\.?\d+', f'Z{new_z:.6f}', line)
+                    new_line = Z_WORD_RE.sub(f'Z{new_z:.6f}', line)
                     processed_lines.append(new_line)
                 else:
                     processed_lines.append(line)
@@ -552,7 +564,9 @@ class GCodeTools:
         width = max_x - min_x + 20
         height = max_y - min_y + 20
         
-        svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+        with open(output_path, 'w') as f:
+            write = f.write
+            write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="{width}mm" height="{height}mm" viewBox="{min_x-10} {min_y-10} {width} {height}" 
      xmlns="http://www.w3.org/2000/svg"
      xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
@@ -564,31 +578,27 @@ class GCodeTools:
   
   <!-- Joined paths -->
   <g stroke="red" stroke-width="0.2" fill="none">
-'''
-        
-        # Draw each joined path
-        for i, curve in enumerate(curves):
-            if hasattr(curve, 'points') and curve.points:
-                # Draw path from points
-                path_data = f"M {curve.points[0].x} {curve.points[0].y}"
-                for point in curve.points[1:]:
-                    path_data += f" L {point.x} {point.y}"
-                
-                svg_content += f'    <path d="{path_data}" stroke="hsl({(i * 137.5) % 360}, 70%, 50%)" stroke-width="0.3"/>\n'
-            elif hasattr(curve, 'start') and hasattr(curve, 'end'):
-                # Draw simple line for start/end curves
-                svg_content += f'    <line x1="{curve.start.x}" y1="{curve.start.y}" x2="{curve.end.x}" y2="{curve.end.y}" stroke="hsl({(i * 137.5) % 360}, 70%, 50%)" stroke-width="0.3"/>\n'
-        
-        svg_content += '''  </g>
+''')
+            
+            # Draw each joined path
+            for i, curve in enumerate(curves):
+                if hasattr(curve, 'points') and curve.points:
+                    # Draw path from points
+                    path_data = f"M {curve.points[0].x} {curve.points[0].y}" + ''.join(
+                        f" L {point.x} {point.y}" for point in curve.points[1:])
+                    
+                    write(f'    <path d="{path_data}" stroke="hsl({(i * 137.5) % 360}, 70%, 50%)" stroke-width="0.3"/>\n')
+                elif hasattr(curve, 'start') and hasattr(curve, 'end'):
+                    # Draw simple line for start/end curves
+                    write(f'    <line x1="{curve.start.x}" y1="{curve.start.y}" x2="{curve.end.x}" y2="{curve.end.y}" stroke="hsl({(i * 137.5) % 360}, 70%, 50%)" stroke-width="0.3"/>\n')
+            
+            write('''  </g>
   
   <!-- Legend -->
   <g font-family="Arial" font-size="2" fill="black">
     <text x="10" y="15">Joined Paths (different colors for each path)</text>
   </g>
-</svg>'''
-        
-        with open(output_path, 'w') as f:
-            f.write(svg_content)
+</svg>''')
         
     def svg_to_gcode(self, svg_path: str, output_path: str = None) -> str:
         """
@@ -815,16 +825,16 @@ class GCodeTools:
     
     def _parse_gcode_line(self, line: str, line_num: int) -> Optional[GCodeLine]:
         """Parse a single G-code line."""
-        # Extract coordinates and commands
-        x_match = re.search(r'X([+-]?\d*\.?\d+)', line)
-        y_match = re.search(r'Y([+-]?\d*\.?\d+)', line)
-        z_match = re.search(r'Z([+-]?\d*\.?\d+)', line)
-        f_match = re.search(r'F([+-]?\d*\.?\d+)', line)
+        # Extract coordinates in a single scan; the first occurrence of each word wins
+        words = {}
+        for letter, value in GCODE_WORD_RE.findall(line):
+            if letter not in words:
+                words[letter] = float(value)
         
-        x = float(x_match.group(1)) if x_match else None
-        y = float(y_match.group(1)) if y_match else None
-        z = float(z_match.group(1)) if z_match else None
-        f = float(f_match.group(1)) if f_match else None
+        x = words.get('X')
+        y = words.get('Y')
+        z = words.get('Z')
+        f = words.get('F')
         
         # Determine if this is a cutting move or tool move
         # Cutting moves have Z values significantly below the material surface
@@ -854,7 +864,9 @@ class GCodeTools:
         width = max_x - min_x + 20
         height = max_y - min_y + 20
         
-        svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+        buf = io.StringIO()
+        write = buf.write
+        write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="{width}mm" height="{height}mm" viewBox="{min_x-10} {min_y-10} {width} {height}" 
      xmlns="http://www.w3.org/2000/svg"
      xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
@@ -866,31 +878,31 @@ class GCodeTools:
   
   <!-- Tool moves (rapid positioning) -->
   <g stroke="blue" stroke-width="0.1" fill="none" stroke-dasharray="2,1">
-'''
+''')
         
         # Draw tool moves
         current_x, current_y = None, None
         for line in self.gcode_lines:
             if line.is_tool_move and line.x is not None and line.y is not None:
                 if current_x is not None and current_y is not None:
-                    svg_content += f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n'
+                    write(f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n')
                 current_x, current_y = line.x, line.y
         
-        svg_content += '''  </g>
+        write('''  </g>
   
   <!-- Cutting moves -->
   <g stroke="red" stroke-width="0.2" fill="none">
-'''
+''')
         
         # Draw cutting moves
         current_x, current_y = None, None
         for line in self.gcode_lines:
             if line.is_cutting and line.x is not None and line.y is not None:
                 if current_x is not None and current_y is not None:
-                    svg_content += f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n'
+                    write(f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n')
                 current_x, current_y = line.x, line.y
         
-        svg_content += '''  </g>
+        write('''  </g>
   
   <!-- Legend -->
   <g font-family="Arial" font-size="2" fill="black">
@@ -899,9 +911,9 @@ class GCodeTools:
     <line x1="10" y1="15" x2="20" y2="15" stroke="red" stroke-width="0.2"/>
     <text x="22" y="17">Cutting moves</text>
   </g>
-</svg>'''
+</svg>''')
         
-        return svg_content
+        return buf.getvalue()
     
     def _create_debug_svg_overlay(self, original_svg: str) -> str:
         """Create debug SVG with original SVG and G-code overlay."""
@@ -910,7 +922,9 @@ class GCodeTools:
         viewbox = root.get('viewBox', '0 0 100 100')
         
         # Create debug SVG
-        debug_svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+        buf = io.StringIO()
+        write = buf.write
+        write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="100%" height="100%" viewBox="{viewbox}" 
      xmlns="http://www.w3.org/2000/svg"
      xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
@@ -924,31 +938,31 @@ class GCodeTools:
   
   <!-- G-code overlay -->
   <g stroke="blue" stroke-width="0.1" fill="none" stroke-dasharray="2,1" opacity="0.7">
-'''
+''')
         
         # Add tool moves
         current_x, current_y = None, None
         for line in self.gcode_lines:
             if line.is_tool_move and line.x is not None and line.y is not None:
                 if current_x is not None and current_y is not None:
-                    debug_svg += f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n'
+                    write(f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n')
                 current_x, current_y = line.x, line.y
         
-        debug_svg += '''  </g>
+        write('''  </g>
   
   <!-- Cutting moves -->
   <g stroke="red" stroke-width="0.2" fill="none" opacity="0.8">
-'''
+''')
         
         # Add cutting moves
         current_x, current_y = None, None
         for line in self.gcode_lines:
             if line.is_cutting and line.x is not None and line.y is not None:
                 if current_x is not None and current_y is not None:
-                    debug_svg += f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n'
+                    write(f'    <line x1="{current_x}" y1="{current_y}" x2="{line.x}" y2="{line.y}"/>\n')
                 current_x, current_y = line.x, line.y
         
-        debug_svg += '''  </g>
+        write('''  </g>
   
   <!-- Legend -->
   <g font-family="Arial" font-size="2" fill="black">
@@ -958,9 +972,9 @@ class GCodeTools:
     <line x1="15" y1="25" x2="25" y2="25" stroke="red" stroke-width="0.2"/>
     <text x="27" y="27">Cutting moves</text>
   </g>
-</svg>'''
+</svg>''')
         
-        return debug_svg
+        return buf.getvalue()
     
     def _read_gcode_file(self, gcode_path: str) -> str:
         """Read G-code file content."""
@@ -1021,7 +1035,7 @@ class GCodeTools:
             # Check if this is a Z command
             if line.startswith('G1 Z') or line.startswith('G0 Z'):
                 # Extract Z value
-                z_match = re.search(r'Z([+-]?\d*\.?\d+)', line)
+                z_match = Z_WORD_RE.search(line)
                 if z_match:
                     z_value = float(z_match.group(1))
                     # Skip if already at this Z position
@@ -1037,20 +1051,20 @@ class GCodeTools:
             # Replace scientific notation and round near-zero values
             if 'X' in line or 'Y' in line:
                 # Extract and clean X coordinate
-                x_match = re.search(r'X([+-]?[\d\.eE\-+]+)', line)
+                x_match = X_SCI_WORD_RE.search(line)
                 if x_match:
                     x_val = float(x_match.group(1))
                     if abs(x_val) < 1e-10:  # Essentially zero
                         x_val = 0.0
-                    line = re.sub(r'X[+-]?[\d\.eE\-+]+', f'X{x_val:.6f}', line)
+                    line = X_SCI_WORD_RE.sub(f'X{x_val:.6f}', line)
 
                 # Extract and clean Y coordinate
-                y_match = re.search(r'Y([+-]?[\d\.eE\-+]+)', line)
+                y_match = Y_SCI_WORD_RE.search(line)
                 if y_match:
                     y_val = float(y_match.group(1))
                     if abs(y_val) < 1e-10:  # Essentially zero
                         y_val = 0.0
-                    line = re.sub(r'Y[+-]?[\d\.eE\-+]+', f'Y{y_val:.6f}', line)
+                    line = Y_SCI_WORD_RE.sub(f'Y{y_val:.6f}', line)
 
             cleaned_lines.append(line)
 
@@ -1058,8 +1072,8 @@ class GCodeTools:
     
     def _extract_position_from_line(self, line: str) -> Optional[Tuple[float, float]]:
         """Extract X, Y position from a G-code line."""
-        x_match = re.search(r'X([+-]?\d*\.?\d+)', line)
-        y_match = re.search(r'Y([+-]?\d*\.?\d+)', line)
+        x_match = X_WORD_RE.search(line)
+        y_match = Y_WORD_RE.search(line)
         
         if x_match and y_match:
             return (float(x_match.group(1)), float(y_match.group(1)))
@@ -1123,7 +1137,7 @@ class GCodeTools:
     
     def _extract_z_from_line(self, line: str) -> Optional[float]:
         """Extract Z coordinate from a G-code line."""
-        z_match = re.search(r'Z([+-]?\d*\.?\d+)', line)
+        z_match = Z_WORD_RE.search(line)
         if z_match:
             return float(z_match.group(1))
         return None
@@ -1153,8 +1167,8 @@ class GCodeTools:
             if i < len(compensated_points):
                 new_x, new_y = compensated_points[i]
                 # Replace coordinates in the original line
-                new_line = re.sub(r'X[+-]?\d*\.?\d+', f'X{new_x:.6f}', original_line)
-                new_line = re.sub(r'Y[+-]?\d*\.?\d+', f'Y{new_y:.6f}', new_line)
+                new_line = X_WORD_RE.sub(f'X{new_x:.6f}', original_line)
+                new_line = Y_WORD_RE.sub(f'Y{new_y:.6f}', new_line)
                 compensated_lines.append(new_line)
             else:
                 compensated_lines.append(original_line)
@@ -1338,17 +1352,12 @@ class GCodeTools:
         # Apply bCNC-style drag knife offset
         offset_points = self._calculate_drag_knife_offset(points)
         
-        # Generate new G-code lines with offset coordinates
+        # Generate new G-code lines with offset coordinates, rewriting X and Y
+        # of each original line in a single substitution pass
         offset_lines = []
-        for i, (original_line, _) in enumerate(cutting_path):
-            if i < len(offset_points):
-                new_x, new_y = offset_points[i]
-                # Replace coordinates in the original line
-                new_line = re.sub(r'X[+-]?\d*\.?\d+', f'X{new_x:.6f}', original_line)
-                new_line = re.sub(r'Y[+-]?\d*\.?\d+', f'Y{new_y:.6f}', new_line)
-                offset_lines.append(new_line)
-            else:
-                offset_lines.append(original_line)
+        for (original_line, _), (new_x, new_y) in zip(cutting_path, offset_points):
+            coords = {'X': f'X{new_x:.6f}', 'Y': f'Y{new_y:.6f}'}
+            offset_lines.append(XY_WORD_RE.sub(lambda m: coords[m.group(1)], original_line))
         
         return offset_lines
     
@@ -1371,107 +1380,61 @@ class GCodeTools:
             offset_point = self._offset_perpendicular(points[0], default_direction, self.params.knife_offset)
             return [offset_point]
             
-        offset_points = []
+        # Work on the whole path as an (N, 2) array instead of per-point tuples
+        pts = np.asarray(points, dtype=float)
         knife_offset = self.params.knife_offset
         
-        # Calculate swivel-aware offset for each point
-        for i in range(len(points)):
-            if i == 0:
-                # First point - use direction to next point
-                direction = self._get_direction(points[0], points[1])
-                offset_point = self._calculate_swivel_offset(points[0], direction, knife_offset)
-                offset_points.append(offset_point)
-            elif i == len(points) - 1:
-                # Last point - use direction from previous point
-                direction = self._get_direction(points[i-1], points[i])
-                offset_point = self._calculate_swivel_offset(points[i], direction, knife_offset)
-                offset_points.append(offset_point)
-            else:
-                # Middle point - calculate swivel direction
-                prev_point = points[i-1]
-                curr_point = points[i]
-                next_point = points[i+1]
-                
-                # Calculate the swivel direction based on curve geometry
-                swivel_direction = self._calculate_swivel_direction(prev_point, curr_point, next_point)
-                offset_point = self._calculate_swivel_offset(curr_point, swivel_direction, knife_offset)
-                offset_points.append(offset_point)
+        # Unit direction of every segment; zero-length segments default to +X
+        seg = np.diff(pts, axis=0)
+        seg_len = np.hypot(seg[:, 0], seg[:, 1])
+        seg_dir = np.empty_like(seg)
+        nonzero = seg_len > 0
+        seg_dir[nonzero] = seg[nonzero] / seg_len[nonzero, None]
+        seg_dir[~nonzero] = (1.0, 0.0)
+        
+        # Swivel direction per point: first/last follow their only segment,
+        # middle points blend incoming and outgoing directions
+        directions = np.empty_like(pts)
+        directions[0] = seg_dir[0]
+        directions[-1] = seg_dir[-1]
+        if len(pts) > 2:
+            directions[1:-1] = self._calculate_swivel_directions(seg_dir[:-1], seg_dir[1:])
         
-        return offset_points
+        # Offset perpendicular to the direction (90 degrees clockwise)
+        offset_points = pts + np.column_stack((directions[:, 1], -directions[:, 0])) * knife_offset
+        
+        return [tuple(p) for p in offset_points.tolist()]
     
-    def _calculate_swivel_direction(self, prev_point: Tuple[float, float], 
-                                  curr_point: Tuple[float, float], 
-                                  next_point: Tuple[float, float]) -> Tuple[float, float]:
+    def _calculate_swivel_directions(self, dir_in: np.ndarray, dir_out: np.ndarray) -> np.ndarray:
         """
-        Calculate the swivel direction for a drag knife at a curve point.
+        Calculate the swivel direction at each interior point of a path.
         
-        The knife blade swivels to follow the cutting direction, so we need to
-        calculate the direction that accounts for the blade's rotation.
+        The knife blade swivels to follow the cutting direction, so each point
+        uses a weighted blend of its incoming and outgoing unit directions
+        ((N, 2) arrays). Corners sharper than sharp_corner_threshold lean
+        further towards the outgoing direction; swivel_sensitivity shifts the
+        weight from dir_in to dir_out in both cases.
         """
-        # Calculate incoming and outgoing directions
-        dir_in = self._get_direction(prev_point, curr_point)
-        dir_out = self._get_direction(curr_point, next_point)
-        
-        # Calculate the angle between directions
-        angle = self._angle_between_vectors(dir_in, dir_out)
-        angle_degrees = abs(angle) * 180 / math.pi
+        # Angle between directions, clamped to avoid numerical errors
+        dot = np.clip(np.einsum('ij,ij->i', dir_in, dir_out), -1.0, 1.0)
+        angle = np.arccos(dot)
         
-        # Use configurable swivel sensitivity and sharp corner threshold
         swivel_sensitivity = self.params.swivel_sensitivity
         sharp_threshold = math.radians(self.params.sharp_corner_threshold)
+        sharp = angle > sharp_threshold
         
-        # For sharp corners, use a weighted average that accounts for swivel
-        if abs(angle) > sharp_threshold:
-            # Sharp corner - use more of the outgoing direction for swivel
-            weight_out = 0.5 + (swivel_sensitivity * 0.3)  # 0.5 to 0.8
-            weight_in = 0.5 - (swivel_sensitivity * 0.3)   # 0.5 to 0.2
-        else:
-            # Smooth curve - use balanced weighting with swivel sensitivity
-            weight_out = 0.4 + (swivel_sensitivity * 0.4)  # 0.4 to 0.8
-            weight_in = 0.6 - (swivel_sensitivity * 0.4)   # 0.6 to 0.2
-        
-        # Calculate weighted average direction
-        swivel_direction = (
-            weight_in * dir_in[0] + weight_out * dir_out[0],
-            weight_in * dir_in[1] + weight_out * dir_out[1]
-        )
-        
-        # Normalize
-        length = math.sqrt(swivel_direction[0]**2 + swivel_direction[1]**2)
-        if length > 0:
-            swivel_direction = (swivel_direction[0] / length, swivel_direction[1] / length)
-        
-        return swivel_direction
-    
-    def _calculate_swivel_offset(self, point: Tuple[float, float], 
-                               direction: Tuple[float, float], 
-                               offset: float) -> Tuple[float, float]:
-        """
-        Calculate offset point accounting for drag knife swivel behavior.
-        
-        The knife blade trails behind the tool center and swivels to follow
-        the cutting direction, so the offset needs to account for this rotation.
-        """
-        # For drag knife, we offset perpendicular to the cutting direction
-        # but we need to consider the blade's swivel angle
+        # Sharp corners lean towards the outgoing direction, smooth curves are balanced
+        weight_in = np.where(sharp, 0.5 - swivel_sensitivity * 0.3, 0.6 - swivel_sensitivity * 0.4)
+        weight_out = np.where(sharp, 0.5 + swivel_sensitivity * 0.3, 0.4 + swivel_sensitivity * 0.4)
         
-        # Calculate perpendicular direction (90 degrees clockwise)
-        perp_x = direction[1]
-        perp_y = -direction[0]
+        swivel = weight_in[:, None] * dir_in + weight_out[:, None] * dir_out
         
-        # Apply the offset
-        offset_point = (
-            point[0] + perp_x * offset,
-            point[1] + perp_y * offset
-        )
+        # Normalize, leaving zero-length results untouched
+        length = np.hypot(swivel[:, 0], swivel[:, 1])
+        nonzero = length > 0
+        swivel[nonzero] /= length[nonzero, None]
         
-        return offset_point
-    
-    def _angle_between_vectors(self, v1: Tuple[float, float], v2: Tuple[float, float]) -> float:
-        """Calculate the angle between two vectors in radians."""
-        dot_product = v1[0] * v2[0] + v1[1] * v2[1]
-        dot_product = max(-1.0, min(1.0, dot_product))  # Clamp to avoid numerical errors
-        return math.acos(dot_product)
+        return swivel
     
     def _calculate_bisector(self, dir1: Tuple[float, float], dir2: Tuple[float, float]) -> Tuple[float, float]:
         """Calculate the bisector of two direction vectors."""
@@ -8,12 +8,13 @@ This version removes all M commands except the first one using regex replacement
 import argparse
 import sys
 import xml.etree.ElementTree as ET
-from typing import List, Tuple, Optional, Dict
-from svgpathtools import svg2paths, wsvg, Path, Line, CubicBezier, QuadraticBezier, Arc
-from shapely.geometry import LineString, Point
-import math
+from typing import List, Tuple, Optional
+from svgpathtools import svg2paths, Path, Line, CubicBezier, QuadraticBezier, Arc
 import re
 
+# Intermediate move command: space + M + space + number,number
+INTERMEDIATE_MOVE_RE = re.compile(r' M [0-9.-]+,[0-9.-]+')
+
 
 class SVGPathJoinerRemoveMRegex:
     """Main class for creating truly continuous SVG paths by removing M commands with regex."""
@@ -38,14 +39,13 @@ class SVGPathJoinerRemoveMRegex:
         Args:
             svg_file: Path to SVG file
         """
-        import xml.etree.ElementTree as ET
-
         # Load paths with svgpathtools
         self.paths, self.attributes = svg2paths(svg_file)
 
-        # Parse SVG to get viewBox and dimensions for proper scaling
-        tree = ET.parse(svg_file)
-        root = tree.getroot()
+        # Read viewBox and dimensions for proper scaling from the root
+        # element only, without building the rest of the tree
+        with open(svg_file, 'rb') as f:
+            _, root = next(ET.iterparse(f, events=('start',)))
         viewbox = root.get('viewBox')
 
         if viewbox:
@@ -191,8 +191,6 @@ class SVGPathJoinerRemoveMRegex:
         Returns:
             List of connected components (each component is a list of path indices)
         """
-        from shapely.geometry import Point
-        
         # Create a graph of connected paths
         graph = {i: [] for i in range(len(self.paths))}
         
@@ -490,9 +488,7 @@ class SVGPathJoinerRemoveMRegex:
             Path data string with intermediate M commands removed
         """
         # Replace " M [0-9.]*,[0-9.]*" with a space
-        # This regex matches: space + M + space + number,number
-        pattern = r' M [0-9.-]+,[0-9.-]+'
-        cleaned_path = re.sub(pattern, ' ', path_data)
+        cleaned_path = INTERMEDIATE_MOVE_RE.sub(' ', path_data)
         
         return cleaned_path
     
@@ -16,10 +16,7 @@ import time
 import sys
 import os
 import tempfile
-from pathlib import Path
 import threading
-import base64
-from io import BytesIO
 
 try:
     import bambulabs_api as bl
@@ -114,7 +111,7 @@ def camera_stream_worker():
         # Start the camera
         if printer.camera_start():
             print("Camera started successfully")
-            time.sleep(1)  # Give camera time to initialize
+            camera_stop_event.wait(1)  # Give camera time to initialize
 
             while not camera_stop_event.is_set():
                 try:
@@ -128,12 +125,12 @@ def camera_stream_worker():
                         # Emit frame to all connected clients
                         socketio.emit('camera_frame', {'frame': processed_frame}, namespace='/')
 
-                    # Limit frame rate to ~10 FPS
-                    time.sleep(0.1)
+                    # Limit frame rate to ~10 FPS; wakes immediately on stop
+                    camera_stop_event.wait(0.1)
 
                 except Exception as e:
                     print(f"Error streaming frame: {e}")
-                    time.sleep(0.5)
+                    camera_stop_event.wait(0.5)
 
             # Stop camera when done
             printer.camera_stop()
@@ -701,9 +698,9 @@ def send_all_gcode():
             success = send_gcode_to_printer(line)
             if not success:
                 errors.append(f"Line {line_num}: Failed to send")
+            time.sleep(0.05)  # Small delay between commands
 
         sent_count += 1
-        time.sleep(0.05)  # Small delay between commands
 
     return jsonify({
         'success': len(errors) == 0,
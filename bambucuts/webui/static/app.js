@@ -9,6 +9,8 @@ let state = {
     printerConnected: false,
     printerIp: '',
     updateInterval: null,
+    statusDelay: 2000,
+    lastStatus: null,
     currentFileName: 'Untitled.gcode',
     lastKissTime: 0,
     lastActionWasKiss: false
@@ -140,6 +142,18 @@ function attachEventListeners() {
     updateLineNumbers();
 }
 
+// Keyboard jog bindings: key -> [axis, direction]
+const KEY_MOVES = {
+    'ArrowUp': ['y', 1],
+    'ArrowDown': ['y', -1],
+    'ArrowLeft': ['x', -1],
+    'ArrowRight': ['x', 1],
+    'u': ['z', 1], 'U': ['z', 1],
+    'j': ['z', -1], 'J': ['z', -1],
+    'e': ['e', 1], 'E': ['e', 1],
+    'd': ['e', -1], 'D': ['e', -1]
+};
+
 // Handle keyboard input
 function handleKeyboard(e) {
     // Don't trigger if typing in input field or textarea
@@ -152,57 +166,23 @@ function handleKeyboard(e) {
         updateKeyboardHighlights(true);
     }
 
-    // Apply 10x finer if Shift is held
-    const stepSize = e.shiftKey ? state.stepSize / 10 : state.stepSize;
-
-    switch(e.key) {
-        case 'ArrowUp':
-            e.preventDefault();
-            moveAxis('y', stepSize);
-            break;
-        case 'ArrowDown':
-            e.preventDefault();
-            moveAxis('y', -stepSize);
-            break;
-        case 'ArrowLeft':
-            e.preventDefault();
-            moveAxis('x', -stepSize);
-            break;
-        case 'ArrowRight':
-            e.preventDefault();
-            moveAxis('x', stepSize);
-            break;
-        case 'u':
-        case 'U':
-            e.preventDefault();
-            state.lastActionWasKiss = false; // Reset kiss flag on manual Z move
-            moveAxis('z', stepSize);
-            break;
-        case 'j':
-        case 'J':
-            e.preventDefault();
+    const move = KEY_MOVES[e.key];
+    if (move) {
+        e.preventDefault();
+        const [axis, dir] = move;
+        // Apply 10x finer if Shift is held
+        const stepSize = e.shiftKey ? state.stepSize / 10 : state.stepSize;
+        if (axis === 'z') {
             state.lastActionWasKiss = false; // Reset kiss flag on manual Z move
-            moveAxis('z', -stepSize);
-            break;
-        case 'e':
-        case 'E':
-            e.preventDefault();
-            moveAxis('e', stepSize);
-            break;
-        case 'd':
-        case 'D':
-            e.preventDefault();
-            moveAxis('e', -stepSize);
-            break;
-        case 'k':
-        case 'K':
-            e.preventDefault();
-            if (e.shiftKey) {
-                microKissZ();
-            } else {
-                kissZ();
-            }
-            break;
+        }
+        moveAxis(axis, dir * stepSize);
+    } else if (e.key === 'k' || e.key === 'K') {
+        e.preventDefault();
+        if (e.shiftKey) {
+            microKissZ();
+        } else {
+            kissZ();
+        }
     }
 }
 
@@ -660,11 +640,22 @@ async function setStepSize(stepSize) {
 
 // Status updates
 
-async function updateStatus() {
+async function updateStatus(fromPoll = false) {
     try {
         const response = await fetch(`${API_BASE}/api/status`);
         const data = await response.json();
 
+        // Poll fast again as soon as anything changes
+        const statusKey = JSON.stringify(data);
+        const changed = statusKey !== state.lastStatus;
+        state.lastStatus = statusKey;
+        if (changed) {
+            state.statusDelay = STATUS_POLL_MIN;
+            if (!fromPoll) {
+                resetStatusPolling();
+            }
+        }
+
         console.log('Status update:', data);
 
         // Update state
@@ -675,8 +666,10 @@ async function updateStatus() {
         // Update UI
         updatePositionDisplay(data.position);
         updateConnectionStatus(data.printer_connected, data.printer_ip, data.connection_error, data.printer_state);
+        return changed;
     } catch (error) {
         console.error('Status update error:', error);
+        return false;
     }
 }
 
@@ -746,16 +739,41 @@ function showNotification(message, type = 'info') {
 }
 
 // Polling
+const STATUS_POLL_MIN = 2000;
+const STATUS_POLL_MAX = 10000;
+
+async function pollStatus() {
+    const timer = state.updateInterval;
+    const changed = await updateStatus(true);
+    if (state.updateInterval !== timer) {
+        return; // Stopped or rescheduled while the request was in flight
+    }
+    if (!changed) {
+        state.statusDelay = Math.min(state.statusDelay * 2, STATUS_POLL_MAX);
+    }
+    state.updateInterval = setTimeout(pollStatus, state.statusDelay);
+}
+
 function startStatusPolling() {
-    // Poll status every 2 seconds
-    state.updateInterval = setInterval(() => {
-        updateStatus();
-    }, 2000);
+    // Poll every 2 seconds, backing off while the status stays the same
+    state.statusDelay = STATUS_POLL_MIN;
+    state.updateInterval = setTimeout(pollStatus, state.statusDelay);
+}
+
+function resetStatusPolling() {
+    // A change seen outside the poll (e.g. after connecting) should not wait
+    // out a backed-off timer; poll fast again from now
+    if (!state.updateInterval) {
+        return; // Polling is stopped
+    }
+    clearTimeout(state.updateInterval);
+    state.statusDelay = STATUS_POLL_MIN;
+    state.updateInterval = setTimeout(pollStatus, state.statusDelay);
 }
 
 function stopStatusPolling() {
     if (state.updateInterval) {
-        clearInterval(state.updateInterval);
+        clearTimeout(state.updateInterval);
         state.updateInterval = null;
     }
 }
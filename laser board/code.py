@@ -35,6 +35,11 @@ import time
 import digitalio
 import microcontroller
 import pwmio
+import struct
+from micropython import const
+
+# Per-frame logging; printing over USB serial is slower than the frame itself
+DEBUG = const(False)
 
 # Try board.LED first; if it doesn't exist, manually set GPIO15
 
@@ -125,49 +130,54 @@ KNOWN=[
     "3d05b1011000f1000e00090301ff195d",
     "3d05ad0210004f000e00090301ff8321",
 ]
+# Raw bytes for a hash lookup; lengths let most frames skip it without a copy
+KNOWN_BYTES = frozenset(bytes.fromhex(h) for h in KNOWN)
+KNOWN_LENGTHS = frozenset(len(k) for k in KNOWN_BYTES)
 
 print("Bambu-Bus RX byte-by-byte @1228800 8E1...")
 
 START = 0x3D
 
-# Single accumulate state
-frame = bytearray()
-expected_len = 0
-flag_byte = None
+# Single accumulate buffer, no per-byte growth; the fill index and expected
+# length live as locals in _main_loop
+BUFCAP = 5000  # largest long-header frame we accept
+frame = bytearray(BUFCAP)
+frame_view = memoryview(frame)
 
 ok_frames = 0
 crc_err = 0
 len_err = 0
-last_report = time.monotonic()
+last_error_report = 0
+
+def log_error(*args):
+    """Print an error at most once per second, counters keep the totals."""
+    global last_error_report
+    now = time.monotonic()
+    if DEBUG or now - last_error_report >= 1:
+        print(*args)
+        last_error_report = now
  
 
-def reset():
-    global frame, expected_len, flag_byte
-    frame = bytearray()
-    expected_len = 0
-    flag_byte = None
-
-def finish_if_complete():
-    """Returns True if frame was complete and processed (and reset)."""
-    global ok_frames, crc_err, len_err
-    if expected_len and len(frame) == expected_len:
-        # Process and reset
-        #print("full frame", frame.hex())
-        if process_frame(frame):
+def finish_if_complete(frame_len, expected_len, frame_handler):
+    """Returns the new fill index if the frame ended (processed or dropped), else None."""
+    global ok_frames, len_err
+    if expected_len and frame_len == expected_len:
+        # Process; the buffer is reused for the next frame
+        #print("full frame", frame[:frame_len].hex())
+        if process_frame(frame_view[:frame_len], frame_handler):
             ok_frames += 1
-        reset()
-        return True
-    elif expected_len and len(frame) > expected_len:
-        print("Bad frame", frame.hex())
+        return 0
+    elif expected_len and frame_len > expected_len:
+        log_error("Bad frame", frame[:frame_len].hex())
         # Overshoot -> resync
         len_err += 1
         # Try to resync from current byte if it's a start byte, else full reset
-        last = frame[-1]
-        reset()
+        last = frame[frame_len - 1]
         if last == START:
-            frame.append(last)
-        return False
-    return False
+            frame[0] = last
+            return 1
+        return 0
+    return None
 
 last_power_countdown = 0
 
@@ -178,11 +188,13 @@ def set_power(power):
 def process_packet(payload):
     global last_power_countdown
     try:
-        print("Payload",payload.hex(' '));
+        if DEBUG:
+            print("Payload",payload.hex(' '));
         value = payload[0] * 4 + payload[1]
         address = payload[2]
         
-        print(f"a={address}, v={value}")
+        if DEBUG:
+            print(f"a={address}, v={value}")
         
         if address == 0:
             set_power(value)
@@ -192,86 +204,93 @@ def process_packet(payload):
         print(e)
         
     
-def process_frame(buf: bytearray) -> bool:
-    """Validate and print a decoded frame. Returns True if valid."""
-    global crc_err, len_err
+def process_frame(buf: memoryview, handler) -> bool:
+    """Validate and print a decoded frame. Returns True if valid.
+
+    handler is _process_long or _process_short, picked from the flag byte
+    while the frame was being framed.
+    """
+    global len_err
     if len(buf) < 4:
         len_err += 1
         return False
         
-    if buf.hex() in KNOWN:
+    # Known pings are the bulk of the traffic: accept them before any CRC work
+    if len(buf) in KNOWN_LENGTHS and bytes(buf) in KNOWN_BYTES:
         #print("ping")
         return True 
         
     #print(f"frame {len(buf)}", buf[:100].hex())
 
-    flag = buf[1]
-
-    # ---------- Long header ----------
-    if flag < 0x80:
-        if len(buf) < 13:
-            len_err += 1
-            return False
-        L = (buf[5] << 8) | buf[4]
-        if L != len(buf):
-            len_err += 1
-            print("Bad length (long):", len(buf), "expected:", L)
-            return False
-
-        if crc8_0x39(bytes(buf[0:6])) != buf[6]:
-            crc_err += 1
-            print("Bad CRC8 (long)")
-            return False
-
-        crc_region = bytes(buf[0:L - 2])
-        crc_calc = crc16_ccitt_0x1021(crc_region)
-        crc_seen = buf[L - 2] | (buf[L - 1] << 8)
-        if crc_calc != crc_seen:
-            crc_err += 1
-            print("Bad CRC16 (long)")
-            return False
-
-        seq = (buf[2] << 8) | buf[3]
-        tgt = (buf[7] << 8) | buf[8]
-        src = (buf[9] << 8) | buf[10]
-        payload = bytes(buf[11:L - 2])
-        if payload.hex(" ") not in ["03 01 fe","03 01 ff"]:
-            print(f"[LONG] seq={seq} src=0x{src:04X}->dst=0x{tgt:04X} len={L} payload={payload.hex(' ')}")
-            
-        return True
-
-    # ---------- Short header ----------
-    else:
-        if len(buf) < 7:
-            len_err += 1
-            return False
-        L = buf[2]
-        if L != len(buf):
-            len_err += 1
-            print("Bad length (short):", len(buf), "expected:", L)
-            return False
-        c8 = crc8_0x39(bytes(buf[0:3]))
-        if c8 != buf[3]:
-            crc_err += 1
-            print(f"Bad CRC8 (short) {c8} != {buf[3]}")
-            return False
-
-        crc_region = bytes(buf[0:L - 2])
-        crc_calc = crc16_ccitt_0x1021(crc_region)
-        crc_seen = buf[L - 2] | (buf[L - 1] << 8)
-        if crc_calc != crc_seen:
-            crc_err += 1
-            print(f"Bad CRC16 (short) {crc_calc} != {crc_seen}")
-            return False
-
-        pkt_type = buf[4]
-        payload = bytes(buf[5:L - 2])
+    return handler(buf)
+
+# ---------- Long header ----------
+def _process_long(buf: memoryview) -> bool:
+    global crc_err, len_err
+    if len(buf) < 13:
+        len_err += 1
+        return False
+    L = struct.unpack_from("<H", buf, 4)[0]
+    if L != len(buf):
+        len_err += 1
+        log_error("Bad length (long):", len(buf), "expected:", L)
+        return False
+
+    if crc8_0x39(buf[:6]) != buf[6]:
+        crc_err += 1
+        log_error("Bad CRC8 (long)")
+        return False
+
+    crc_region = buf[:L - 2]  # memoryview slice: no copy, iterates as ints
+    crc_calc = crc16_ccitt_0x1021(crc_region)
+    crc_seen = struct.unpack_from("<H", buf, L - 2)[0]
+    if crc_calc != crc_seen:
+        crc_err += 1
+        log_error("Bad CRC16 (long)")
+        return False
+
+    seq = struct.unpack_from(">H", buf, 2)[0]
+    tgt = struct.unpack_from(">H", buf, 7)[0]
+    src = struct.unpack_from(">H", buf, 9)[0]
+    payload = bytes(buf[11:L - 2])
+    if DEBUG and payload.hex(" ") not in ["03 01 fe","03 01 ff"]:
+        print(f"[LONG] seq={seq} src=0x{src:04X}->dst=0x{tgt:04X} len={L} payload={payload.hex(' ')}")
+        
+    return True
+
+# ---------- Short header ----------
+def _process_short(buf: memoryview) -> bool:
+    global crc_err, len_err
+    if len(buf) < 7:
+        len_err += 1
+        return False
+    L = buf[2]
+    if L != len(buf):
+        len_err += 1
+        log_error("Bad length (short):", len(buf), "expected:", L)
+        return False
+    c8 = crc8_0x39(buf[:3])
+    if c8 != buf[3]:
+        crc_err += 1
+        log_error(f"Bad CRC8 (short) {c8} != {buf[3]}")
+        return False
+
+    crc_region = buf[:L - 2]  # memoryview slice: no copy, iterates as ints
+    crc_calc = crc16_ccitt_0x1021(crc_region)
+    crc_seen = struct.unpack_from("<H", buf, L - 2)[0]
+    if crc_calc != crc_seen:
+        crc_err += 1
+        log_error(f"Bad CRC16 (short) {crc_calc} != {crc_seen}")
+        return False
+
+    pkt_type = buf[4]
+    payload = bytes(buf[5:L - 2])
+    if DEBUG:
         print(f"[SHORT] type=0x{pkt_type:02X} len={L} payload={payload.hex(' ')}")
-        process_packet(payload)
-        return True
+    process_packet(payload)
+    return True
 
 # ===== Main loop: read ONE BYTE at a time =====
-reset()
 
 print("Hello")
 ticks = 0
@@ -287,60 +306,91 @@ def tick():
             
     pass 
     
-while True:
-    b = uart.read(100)
-    now = time.monotonic()
-    if now - last_report >= 1:
-        print(f"[status] ok={ok_frames} crc_err={crc_err} len_err={len_err} buf={len(frame)}")
-        last_report = now
-        tick()
-    
-    if not b:
-        continue 
+def _main_loop():
+    # Bind everything the per-byte loop touches to locals once: locals are
+    # slot loads, module globals and attributes are dict lookups. That
+    # includes the frame state, which finish_if_complete() hands back.
+    read = uart.read
+    monotonic = time.monotonic
+    unpack_from = struct.unpack_from
+    finish = finish_if_complete
+    buf = frame
+    start = START
+    cap = BUFCAP
+    process_long = _process_long
+    process_short = _process_short
+    frame_len = 0
+    expected_len = 0
+    frame_handler = None
+    last_report = monotonic()
+
+    while True:
+        b = read(100)
+        now = monotonic()
+        if now - last_report >= 1:
+            print(f"[status] ok={ok_frames} crc_err={crc_err} len_err={len_err} buf={frame_len}")
+            last_report = now
+            tick()
         
-    for val in b:
-        if not frame:
-            # Waiting for start byte
-            if val == START:
-                frame.append(val)
-            # else ignore
-            continue
-
-        # We have started a frame; keep accumulating
-        frame.append(val)
-
-        # Capture flag early
-        if len(frame) >= 2:
-            flag_byte = frame[1]
-
-            if flag_byte < 0x80:
-                # Long: need bytes up through length field (index 5)
-                if len(frame) >= 6:
-                    L = (frame[5] << 8) | frame[4]
-                    if L < 7 or L > 5000:
-                        # invalid; resync: if current is start, keep it
-                        print(f"Invalid L={L}",frame)
-                        bad = frame[-1]
-                        reset()
-                        if bad == START:
-                            frame.append(bad)
-                        continue
-                    expected_len = L
-            else:
-                # Short: length at index 2
-                if len(frame) >= 3:
-                    L = frame[2]
-                    if L < 7 or L > 255:
-                        print("Invalid short",frame)
-                        bad = frame[-1]
-                        reset()
-                        if bad == START:
-                            frame.append(bad)
-                        continue
-                    expected_len = L
-
-        # If we now have the full frame, finish immediately (no extra read)
-        finished = finish_if_complete()
-        if finished:
-            # already reset; ready for next byte
-            continue
+        if not b:
+            continue 
+            
+        for val in b:
+            if not frame_len:
+                # Waiting for start byte
+                if val == start:
+                    buf[0] = val
+                    frame_len = 1
+                # else ignore
+                continue
+
+            # We have started a frame; keep accumulating
+            buf[frame_len] = val
+            frame_len += 1
+
+            # Flag byte (index 1) picks the header format
+            if frame_len >= 2:
+                if buf[1] < 0x80:
+                    # Long: need bytes up through length field (index 5)
+                    if frame_len >= 6:
+                        L = unpack_from("<H", buf, 4)[0]
+                        if L < 7 or L > cap:
+                            # invalid; resync: if current is start, keep it
+                            log_error(f"Invalid L={L}",buf[:frame_len])
+                            bad = buf[frame_len - 1]
+                            frame_len = 0
+                            expected_len = 0
+                            frame_handler = None
+                            if bad == start:
+                                buf[0] = bad
+                                frame_len = 1
+                            continue
+                        expected_len = L
+                        frame_handler = process_long
+                else:
+                    # Short: length at index 2
+                    if frame_len >= 3:
+                        L = buf[2]
+                        if L < 7 or L > 255:
+                            log_error("Invalid short",buf[:frame_len])
+                            bad = buf[frame_len - 1]
+                            frame_len = 0
+                            expected_len = 0
+                            frame_handler = None
+                            if bad == start:
+                                buf[0] = bad
+                                frame_len = 1
+                            continue
+                        expected_len = L
+                        frame_handler = process_short
+
+            # If we now have the full frame, finish immediately (no extra read)
+            if expected_len:
+                new_len = finish(frame_len, expected_len, frame_handler)
+                if new_len is not None:
+                    # Frame ended; ready for next byte
+                    frame_len = new_len
+                    expected_len = 0
+                    frame_handler = None
+
+_main_loop()